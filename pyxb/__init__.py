@@ -199,6 +199,10 @@ class ValidationConfig (object):
     generated documents.
     """
 
+    _both = True
+    """Cached value of C{forBinding and forDocument}, maintained by
+    L{_setForBinding} and L{_setForDocument}."""
+
     __forBinding = True
     def _getForBinding (self):
         """C{True} iff validation should be performed when manipulating a
@@ -214,6 +218,7 @@ class ValidationConfig (object):
         if not isinstance(value, bool):
             raise TypeError(value)
         self.__forBinding = value
+        self._both = value and self.__forDocument
         return value
     forBinding = property(_getForBinding)
 
@@ -232,6 +237,7 @@ class ValidationConfig (object):
         if not isinstance(value, bool):
             raise TypeError(value)
         self.__forDocument = value
+        self._both = self.__forBinding and value
         return value
     forDocument = property(_getForDocument)
 
@@ -17,10 +17,12 @@
 inherit, and that describe the content models of those schema."""
 
 import logging
+import sys
 import collections.abc
+import operator
 import xml.dom
 import pyxb
-from pyxb.utils import domutils, utility, six
+from pyxb.utils import domutils, utility
 import pyxb.namespace
 from pyxb.namespace.builtin import XMLSchema_instance as XSI
 import decimal
@@ -32,6 +34,65 @@ except ImportError:
 
 _log = logging.getLogger(__name__)
 
+# NB: pyxb.binding.content imports this module, so it cannot be imported
+# here.  It is always loaded along with this module by pyxb.binding, and is
+# referenced as pyxb.binding.content where needed (as is
+# pyxb.binding.datatypes).
+
+# Accessors for the xsi:type and xsi:nil attributes of a DOM node, resolved
+# once since they are probed for every element converted from DOM.
+_GetXSITypeAttribute = XSI.type.getAttribute
+_GetXSINilAttribute = XSI.nil.getAttribute
+
+# DOM node types that carry character content.
+_TextNodeTypes = (xml.dom.Node.TEXT_NODE, xml.dom.Node.CDATA_SECTION_NODE)
+
+def _CompatibleValueIdentity (cls, value):
+    return value
+
+def _CompatibleValueConstruct (cls, value):
+    return cls(value)
+
+# Map from (defining class, invoking class, method name) to the next
+# implementation of a cooperative method in the MRO of the invoking class, or
+# None if there is none.
+_NextCooperativeCache = {}
+
+def _NextCooperative (defining_cls, cls, name):
+    """Return the implementation of the cooperative method C{name} that
+    follows the one in C{defining_cls} in the MRO of C{cls}, or C{None}.
+
+    This replaces a per-call C{getattr(super(defining_cls, ...), name,
+    default)} with a lookup that is resolved once per class.  For instance
+    methods C{cls} is the type of the instance and the result is a plain
+    function, to be invoked with the instance as its first argument; for
+    class methods the result is already bound to C{cls}."""
+    key = (defining_cls, cls, name)
+    try:
+        return _NextCooperativeCache[key]
+    except KeyError:
+        pass
+    rv = getattr(super(defining_cls, cls), name, None)
+    _NextCooperativeCache[key] = rv
+    return rv
+
+# Map from (binding class, type of value) to the result of
+# _TypeBinding_mixin._RequireXSIType.  Cleared whenever a superseding class
+# is changed.
+_RequireXSITypeCache = {}
+
+# Map from (binding class, Python type of value) to the handler for the
+# outcome of _TypeBinding_mixin._CompatibleValue when that outcome is fully
+# determined by the pair.  Outcomes that depend on the value itself or on
+# keywords (string conversion, unions, BIND, simple content) are not cached.
+_CompatibleValueHandlers = {}
+
+# Map from complex type binding class to a triple of the sizes of its
+# attribute and element maps and its full description.  The text includes
+# the descriptions of element declarations, so it is cleared whenever a
+# superseding class or a substitution group is changed.
+_CTDDescriptionCache = {}
+
 class _TypeBinding_mixin (utility.Locatable_mixin):
     # Private member holding the validation configuration that applies to the
     # class or instance.  Can't really make it private with __ prefix because
@@ -63,7 +124,8 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         L{pyxb.GlobalValidationConfig}."""
         return self._validationConfig_
 
-    # This is how you should be accessing this value.
+    # This is how you should be accessing this value.  Code within PyXB reads
+    # _validationConfig_ directly to avoid the property overhead.
     _validationConfig = property(__getValidationConfig)
 
     @classmethod
@@ -75,8 +137,7 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
 
         @deprecated: use L{_GetValidationConfig} and check specific requirements."""
         # Bypass the property since this is a class method
-        vo = cls._validationConfig_
-        return vo.forBinding and vo.forDocument
+        return cls._validationConfig_._both
 
     def _performValidation (self):
         """Determine whether the content model should be validated for this
@@ -86,8 +147,7 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         document validation are in force.
 
         @deprecated: use L{_validationConfig} and check specific requirements."""
-        vo = self._validationConfig
-        return vo.forBinding and vo.forDocument
+        return self._validationConfig_._both
 
     _ExpandedName = None
     """The expanded name of the component."""
@@ -95,13 +155,17 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
     _XSDLocation = None
     """Where the definition can be found in the originating schema."""
 
-    _ReservedSymbols = set([ 'validateBinding', 'toDOM', 'toxml', 'Factory', 'property' ])
+    _ReservedSymbols = frozenset([ 'validateBinding', 'toDOM', 'toxml', 'Factory', 'property' ])
 
     if pyxb._CorruptionDetectionEnabled:
         def __setattr__ (self, name, value):
-            if name in self._ReservedSymbols:
+            # Reserved symbols are all public, so the (common) assignments to
+            # protected and private members need not be checked.  No class
+            # following this one in the MRO of a binding overrides
+            # __setattr__, so go straight to the object implementation.
+            if ('_' != name[:1]) and (name in self._ReservedSymbols):
                 raise pyxb.ReservedNameError(self, name)
-            return super(_TypeBinding_mixin, self).__setattr__(name, value)
+            return object.__setattr__(self, name, value)
 
     _PyXBFactoryKeywords = ( '_dom_node', '_fallback_namespace', '_from_xml',
                              '_apply_whitespace_facet', '_validate_constraints',
@@ -141,7 +205,6 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         @param elt: the L{pyxb.binding.basis.element} instance associated with
         the value.  This may be C{None} when disassociating a value from a
         specific element."""
-        import pyxb.binding.content
         assert (elt is None) or isinstance(elt, element)
         self.__element = elt
         return self
@@ -183,8 +246,9 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         """
         if self.__xsiNil is None:
             raise pyxb.NoNillableSupportError(self)
-        self.__xsiNil = not not nil
-        if self.__xsiNil:
+        nil = bool(nil)
+        self.__xsiNil = nil
+        if nil:
             # The element must be empty, so also remove all element content.
             # Attribute values are left unchanged.
             self._resetContent(reset_elements=True)
@@ -213,16 +277,21 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
 
     __constructedWithValue = False
     def __checkNilCtor (self, args):
-        self.__constructedWithValue = (0 < len(args))
+        # Only store the flag when it differs from the class default, so
+        # instances constructed without a value do not carry it in their
+        # dictionary.
+        constructed_with_value = (0 < len(args))
         if self.__xsiNil:
-            if self.__constructedWithValue:
+            if constructed_with_value:
                 raise pyxb.ContentInNilInstanceError(self, args[0])
         else:
             # Types that descend from string will, when constructed from an
             # element with empty content, appear to have no constructor value,
             # while in fact an empty string should have been passed.
-            if issubclass(type(self), six.string_types):
-                self.__constructedWithValue = True
+            if issubclass(type(self), str):
+                constructed_with_value = True
+        if constructed_with_value:
+            self.__constructedWithValue = True
     def _constructedWithValue (self):
         return self.__constructedWithValue
 
@@ -303,14 +372,27 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         # customizations will be found.
         dom_node = kw.get('_dom_node')
         location = kw.get('_location')
-        if (location is None) and isinstance(dom_node, utility.Locatable_mixin):
-            location = dom_node._location()
-        kw.setdefault('_from_xml', dom_node is not None)
-        used_cls = cls._SupersedingClass()
+        if dom_node is None:
+            # Programmatic construction, the common case: there is no node
+            # from which to take a location.
+            kw.setdefault('_from_xml', False)
+        else:
+            if (location is None) and isinstance(dom_node, utility.Locatable_mixin):
+                location = dom_node._location()
+            kw.setdefault('_from_xml', True)
+        # Inline _DynamicCreate_mixin._SupersedingClass and
+        # _DynamicCreate_mixin._DynamicCreate: this is the hot path for
+        # instance creation.
+        cls_dict = cls.__dict__
+        used_cls = cls_dict.get('_DynamicCreate_mixin__SupersedingClass', cls)
         state = used_cls._PreFactory_vx(args, kw)
-        rv = cls._DynamicCreate(*args, **kw)
+        ctor = cls_dict.get('_DynamicCreate_mixin__Constructor', cls)
+        try:
+            rv = ctor(*args, **kw)
+        except TypeError:
+            raise pyxb.SimpleTypeValueError(ctor, args)
         rv._postFactory_vx(state)
-        if (rv._location is None) and (location is not None):
+        if (location is not None) and (rv._location is None):
             rv._setLocation(location)
         return rv
 
@@ -330,6 +412,19 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
 
     @classmethod
     def _RequireXSIType (cls, value_type):
+        """Return C{True} iff an element of this type holding a value of type
+        C{value_type} must carry an C{xsi:type} attribute.
+
+        The result depends only on the two types (and on superseding classes,
+        changes to which clear the cache), so it is memoized."""
+        key = (cls, value_type)
+        rv = _RequireXSITypeCache.get(key)
+        if rv is None:
+            rv = _RequireXSITypeCache[key] = cls.__RequireXSIType(value_type)
+        return rv
+
+    @classmethod
+    def __RequireXSIType (cls, value_type):
         if cls._IsUrType():
             # Require xsi:type if value refines xs:anyType
             return value_type != cls
@@ -371,37 +466,41 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         @raise pyxb.SimpleTypeValueError: if the value is not both
         type-consistent and value-consistent with the element's type.
         """
-        convert_string_values = kw.get('_convert_string_values', True)
         # None is always None
         if value is None:
             return None
+        value_type = type(value)
+        handler_key = (cls, value_type)
+        handler = _CompatibleValueHandlers.get(handler_key)
+        if handler is not None:
+            return handler(cls, value)
+        convert_string_values = kw.get('_convert_string_values', True)
         # Already an instance?
         if isinstance(value, cls):
             # @todo: Consider whether we should change the associated _element
             # of this value.  (**Consider** it, don't just do it.)
+            _CompatibleValueHandlers[handler_key] = _CompatibleValueIdentity
             return value
-        value_type = type(value)
-        # All string-based PyXB binding types use unicode, not str
-        if six.PY2 and str == value_type:
-            value_type = six.text_type
-
         # See if we got passed a Python value which needs to be "downcasted"
         # to the _TypeBinding_mixin version.
         if issubclass(cls, value_type):
+            _CompatibleValueHandlers[handler_key] = _CompatibleValueConstruct
             return cls(value)
 
         # See if we have a numeric type that needs to be cast across the
         # numeric hierarchy.  int to long is the *only* conversion we accept.
-        if isinstance(value, int) and issubclass(cls, six.long_type):
+        if isinstance(value, int) and issubclass(cls, int):
+            _CompatibleValueHandlers[handler_key] = _CompatibleValueConstruct
             return cls(value)
 
         # Same, but for boolean, which Python won't let us subclass
         if isinstance(value, bool) and issubclass(cls, pyxb.binding.datatypes.boolean):
+            _CompatibleValueHandlers[handler_key] = _CompatibleValueConstruct
             return cls(value)
 
         # See if we have convert_string_values on, and have a string type that
         # somebody understands.
-        if convert_string_values and value_type == six.text_type:
+        if convert_string_values and value_type == str:
             return cls(value)
 
         # Maybe this is a union?
@@ -465,17 +564,37 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
     """Map from expanded names to AttributeUse instances.  Non-empty only in
     L{complexTypeDefinition} subclasses."""
 
+    @classmethod
+    def __AttributeMapItems (cls):
+        """Return a tuple of C{(id, name, attribute_use)} triples for the
+        members of L{_AttributeMap}.
+
+        The tuple is computed on first use and cached on the class.  It is
+        recomputed if the size of the attribute map changes, which happens
+        only while the binding class is being constructed."""
+        rv = cls.__dict__.get('_TypeBinding_mixin__attributeMapItems')
+        if (rv is None) or (len(rv) != len(cls._AttributeMap)):
+            rv = tuple( (_au.id(), _au.name(), _au) for _au in cls._AttributeMap.values() )
+            cls.__attributeMapItems = rv
+        return rv
+
     @classmethod
     def __AttributesFromDOM (cls, node):
         attribute_settings = { }
-        for ai in range(0, node.attributes.length):
-            attr = node.attributes.item(ai)
+        make_name = pyxb.namespace.ExpandedName._FromNSLocal
+        # Namespace instances are unique per URI, so identity suffices.
+        xmlns_ns = pyxb.namespace.XMLNamespaces
+        xsi_ns = XSI
+        attributes = node.attributes
+        for ai in range(attributes.length):
+            attr = attributes.item(ai)
             # NB: Specifically do not consider attr's NamespaceContext, since
             # attributes do not accept a default namespace.
-            attr_en = pyxb.namespace.ExpandedName(attr)
+            attr_en = make_name(attr.namespaceURI, attr.localName)
 
             # Ignore xmlns and xsi attributes; we've already handled those
-            if attr_en.namespace() in ( pyxb.namespace.XMLNamespaces, XSI ):
+            attr_ns = attr_en.namespace()
+            if (attr_ns is xmlns_ns) or (attr_ns is xsi_ns):
                 continue
 
             attribute_settings[attr_en] = attr.value
@@ -495,14 +614,20 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         """
 
         # Extract keywords that match field names
-        attribute_settings = { }
-        if dom_node is not None:
-            attribute_settings.update(self.__AttributesFromDOM(dom_node))
-        for fu in six.itervalues(self._AttributeMap):
-            iv = kw.pop(fu.id(), None)
+        if dom_node is None:
+            # Without a node there is nothing for keywords to override, so
+            # assign them as they are found.
+            for (au_id, au_name, _) in self.__AttributeMapItems():
+                iv = kw.pop(au_id, None)
+                if iv is not None:
+                    self._setAttribute(au_name, iv)
+            return
+        attribute_settings = self.__AttributesFromDOM(dom_node)
+        for (au_id, au_name, _) in self.__AttributeMapItems():
+            iv = kw.pop(au_id, None)
             if iv is not None:
-                attribute_settings[fu.name()] = iv
-        for (attr_en, value_lex) in six.iteritems(attribute_settings):
+                attribute_settings[au_name] = iv
+        for (attr_en, value_lex) in attribute_settings.items():
             self._setAttribute(attr_en, value_lex)
 
     def toDOM (self, bds=None, parent=None, element_name=None):
@@ -521,9 +646,13 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         """
 
         if bds is None:
-            bds = domutils.BindingDOMSupport()
+            bds = domutils.BindingDOMSupport._AcquireDefault()
+            try:
+                return self.toDOM(bds, parent, element_name)
+            finally:
+                domutils.BindingDOMSupport._ReleaseDefault(bds)
         need_xsi_type = bds.requireXSIType()
-        if isinstance(element_name, six.string_types):
+        if isinstance(element_name, str):
             element_name = pyxb.namespace.ExpandedName(bds.defaultNamespace(), element_name)
         if (element_name is None) and (self._element() is not None):
             element_binding = self._element()
@@ -571,7 +700,10 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         assert parent is not None
         if self.__xsiNil:
             dom_support.addAttribute(parent, XSI.nil, 'true')
-        return getattr(super(_TypeBinding_mixin, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+        next_csc = _NextCooperative(_TypeBinding_mixin, type(self), '_toDOM_csc')
+        if next_csc is None:
+            return dom_support
+        return next_csc(self, dom_support, parent)
 
     def _validateBinding_vx (self):
         """Override in subclasses for type-specific validation of instance
@@ -590,7 +722,7 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         @raise pyxb.BatchContentValidationError: complex content does not match model
         @raise pyxb.SimpleTypeValueError: attribute or simple content fails to satisfy constraints
         """
-        if self._performValidation():
+        if self._validationConfig_._both:
             self._validateBinding_vx()
         return True
 
@@ -614,8 +746,8 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         is the expanded name if the type has one, or the Python type name if
         it does not."""
         if cls._ExpandedName is not None:
-            return six.text_type(cls._ExpandedName)
-        return six.text_type(cls)
+            return str(cls._ExpandedName)
+        return str(cls)
 
     def _diagnosticName (self):
         """The best name available for this instance in diagnostics.
@@ -624,7 +756,7 @@ class _TypeBinding_mixin (utility.Locatable_mixin):
         otherwise it is the best name for the type of the instance per L{_Name}."""
         if self.__element is None:
             return self._Name()
-        return six.text_type(self.__element.name())
+        return str(self.__element.name())
 
 class _DynamicCreate_mixin (pyxb.cscRoot):
     """Helper to allow overriding the implementation class.
@@ -644,26 +776,40 @@ class _DynamicCreate_mixin (pyxb.cscRoot):
 
     """
 
-    @classmethod
-    def __SupersedingClassAttribute (cls):
-        return '_%s__SupersedingClass' % (cls.__name__,)
+    # Names of the attributes holding the superseding class and alternative
+    # constructor.  These are only consulted in the dictionary of the class
+    # on which they were set, so the lookup does not depend on the class name
+    # and is not inherited by subclasses.
+    __SupersedingClassAttribute = '_DynamicCreate_mixin__SupersedingClass'
+    __AlternativeConstructorAttribute = '_DynamicCreate_mixin__AlternativeConstructor'
+
+    # Name of the attribute holding the callable used by _DynamicCreate: the
+    # alternative constructor if there is one, otherwise the superseding
+    # class.  Absent if neither is set, in which case the class itself is
+    # used.
+    __ConstructorAttribute = '_DynamicCreate_mixin__Constructor'
 
     @classmethod
-    def __AlternativeConstructorAttribute (cls):
-        return '_%s__AlternativeConstructor' % (cls.__name__,)
+    def __UpdateConstructor (cls):
+        ctor = cls._AlternativeConstructor()
+        if ctor is None:
+            ctor = cls._SupersedingClass()
+        attr = cls.__ConstructorAttribute
+        if ctor is cls:
+            if attr in cls.__dict__:
+                delattr(cls, attr)
+        else:
+            setattr(cls, attr, ctor)
 
     @classmethod
     def _SupersedingClass (cls):
         """Return the class stored in the class reference attribute."""
-        return getattr(cls, cls.__SupersedingClassAttribute(), cls)
+        return cls.__dict__.get(cls.__SupersedingClassAttribute, cls)
 
     @classmethod
     def _AlternativeConstructor (cls):
         """Return the class stored in the class reference attribute."""
-        rv = getattr(cls, cls.__AlternativeConstructorAttribute(), None)
-        if isinstance(rv, tuple):
-            rv = rv[0]
-        return rv
+        return cls.__dict__.get(cls.__AlternativeConstructorAttribute)
 
     @classmethod
     def _SetSupersedingClass (cls, superseding):
@@ -672,31 +818,35 @@ class _DynamicCreate_mixin (pyxb.cscRoot):
         @param superseding: A Python class that is a subclass of this class.
         """
         assert (superseding is None) or issubclass(superseding, cls)
+        attr = cls.__SupersedingClassAttribute
         if superseding is None:
-            cls.__dict__.pop(cls.__SupersedingClassAttribute(), None)
+            if attr in cls.__dict__:
+                delattr(cls, attr)
         else:
-            setattr(cls, cls.__SupersedingClassAttribute(), superseding)
+            setattr(cls, attr, superseding)
+        cls.__UpdateConstructor()
+        _RequireXSITypeCache.clear()
+        _CTDDescriptionCache.clear()
         return superseding
 
     @classmethod
     def _SetAlternativeConstructor (cls, alternative_constructor):
-        attr = cls.__AlternativeConstructorAttribute()
+        attr = cls.__AlternativeConstructorAttribute
         if alternative_constructor is None:
-            cls.__dict__.pop(attr, None)
+            if attr in cls.__dict__:
+                delattr(cls, attr)
         else:
-            # Need to use a tuple as the value: if you use an invokable, this
-            # ends up converting it from a function to an unbound method,
-            # which is not what we want.
-            setattr(cls, attr, (alternative_constructor,))
+            # The value is retrieved from the class dictionary, so storing a
+            # function here does not convert it to an unbound method.
+            setattr(cls, attr, alternative_constructor)
+        cls.__UpdateConstructor()
         assert cls._AlternativeConstructor() == alternative_constructor
         return alternative_constructor
 
     @classmethod
     def _DynamicCreate (cls, *args, **kw):
         """Invoke the constructor for this class or the one that supersedes it."""
-        ctor = cls._AlternativeConstructor()
-        if ctor is None:
-            ctor = cls._SupersedingClass()
+        ctor = cls.__dict__.get(cls.__ConstructorAttribute, cls)
         try:
             return ctor(*args, **kw)
         except TypeError:
@@ -708,7 +858,7 @@ class _RepresentAsXsdLiteral_mixin (pyxb.cscRoot):
     This is necessary for any simple data type where Python repr() produces a
     constructor call involving a class that may not be available by that name;
     e.g. duration, decimal, and any of the date/time types."""
-    pass
+    __slots__ = ()
 
 class _NoNullaryNonNillableNew_mixin (pyxb.cscRoot):
     """Marker class indicating that a simple data type cannot construct
@@ -716,7 +866,7 @@ class _NoNullaryNonNillableNew_mixin (pyxb.cscRoot):
 
     This class should appear immediately L{simpleTypeDefinition} (or whatever
     inherits from L{simpleTypeDefinition} in cases where it applies."""
-    pass
+    __slots__ = ()
 
 class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
     """L{simpleTypeDefinition} is a base class that is part of the
@@ -735,6 +885,19 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     # Note that each descendent of simpleTypeDefinition has its own map.
     __FacetMap = {}
 
+    # Variety of the simple type, mirroring
+    # pyxb.xmlschema.structures.SimpleTypeDefinition.  A class constant, so
+    # code that must distinguish list and union types need not use
+    # issubclass.  STD_list and STD_union override _Variety.
+    _VARIETY_atomic = 'atomic'
+    _VARIETY_list = 'list'
+    _VARIETY_union = 'union'
+    _Variety = _VARIETY_atomic
+
+    # The whiteSpace facet, if any, applied by _ConvertArguments.  Defined
+    # here so that classes without one resolve it without a failed lookup.
+    _CF_whiteSpace = None
+
     _ReservedSymbols = _TypeBinding_mixin._ReservedSymbols.union(set([ 'XsdLiteral', 'xsdLiteral',
                             'XsdSuperType', 'XsdPythonType', 'XsdConstraintsOK',
                             'xsdConstraintsOK', 'XsdValueLength', 'xsdValueLength',
@@ -785,6 +948,8 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
                 except Exception:
                     pass
                 nm = '_' + utility.MakeIdentifier('%s_%s_FacetMap' % (ns_uri, nm))
+            # Interned so lookups of the class attribute match by identity.
+            nm = sys.intern(nm)
             cls.__FacetMapAttributeNameMap[cls] = nm
         return nm
 
@@ -799,7 +964,10 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         constraint type.
 
         @raise AttributeError: if the facet map has not been defined"""
-        return getattr(cls, cls.__FacetMapAttributeName())
+        nm = cls.__FacetMapAttributeNameMap.get(cls)
+        if nm is None:
+            nm = cls.__FacetMapAttributeName()
+        return getattr(cls, nm)
 
     @classmethod
     def _InitializeFacetMap (cls, *args):
@@ -850,6 +1018,9 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         for facet in args:
             fm[type(facet)] = facet
         setattr(cls, cls.__FacetMapAttributeName(), fm)
+        # Most classes can have their constraint sequence computed now, which
+        # keeps that work off the first validation.
+        cls.__ClassFacetSequenceFor()
         return fm
 
     @classmethod
@@ -874,10 +1045,10 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
                 args = (domutils.ExtractTextContent(dom_node),) + args
                 kw['_apply_whitespace_facet'] = True
         apply_whitespace_facet = kw.pop('_apply_whitespace_facet', from_xml)
-        if (0 < len(args)) and isinstance(args[0], six.string_types) and apply_whitespace_facet:
-            cf_whitespace = getattr(cls, '_CF_whiteSpace', None)
+        if apply_whitespace_facet and (0 < len(args)) and isinstance(args[0], str):
+            cf_whitespace = cls._CF_whiteSpace
             if cf_whitespace is not None:
-                norm_str = six.text_type(cf_whitespace.normalizeString(args[0]))
+                norm_str = str(cf_whitespace.normalizeString(args[0]))
                 args = (norm_str,) + args[1:]
         kw['_from_xml'] = from_xml
         return cls._ConvertArguments_vx(args, kw)
@@ -893,29 +1064,35 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     # of building a value that eventually will be legal, but isn't
     # yet.
     def __new__ (cls, *args, **kw):
-        # PyXBFactoryKeywords
-        kw.pop('_validate_constraints', None)
-        kw.pop('_require_value', None)
-        kw.pop('_element', None)
-        kw.pop('_fallback_namespace', None)
-        kw.pop('_apply_attributes', None)
-        is_nil = kw.pop('_nil', None)
-        # ConvertArguments will remove _dom_node, _element, and
-        # _apply_whitespace_facet, and it will set _from_xml.
-        args = cls._ConvertArguments(args, kw)
-        from_xml = kw.pop('_from_xml', False)
-        if ((0 == len(args))
-            and from_xml
-            and not is_nil
-            and issubclass(cls, _NoNullaryNonNillableNew_mixin)):
-            raise pyxb.SimpleTypeValueError(cls, args);
-        kw.pop('_location', None)
+        if kw:
+            # PyXBFactoryKeywords
+            kw.pop('_validate_constraints', None)
+            kw.pop('_require_value', None)
+            kw.pop('_element', None)
+            kw.pop('_fallback_namespace', None)
+            kw.pop('_apply_attributes', None)
+            is_nil = kw.pop('_nil', None)
+            # ConvertArguments will remove _dom_node, _element, and
+            # _apply_whitespace_facet, and it will set _from_xml.
+            args = cls._ConvertArguments(args, kw)
+            from_xml = kw.pop('_from_xml', False)
+            if ((0 == len(args))
+                and from_xml
+                and not is_nil
+                and issubclass(cls, _NoNullaryNonNillableNew_mixin)):
+                raise pyxb.SimpleTypeValueError(cls, args);
+            kw.pop('_location', None)
+        else:
+            # Direct construction from a value: there are no keywords to
+            # strip, and no DOM node or whitespace facet to apply.
+            args = cls._ConvertArguments_vx(args, kw)
         assert issubclass(cls, _TypeBinding_mixin)
         try:
-            parent = super(simpleTypeDefinition, cls)
-            if parent.__new__ is object.__new__:
-                return parent.__new__(cls)
-            return parent.__new__(cls, *args, **kw)
+            # The Python base type constructor is resolved once per class.
+            parent_new = _NextCooperative(simpleTypeDefinition, cls, '__new__')
+            if parent_new is object.__new__:
+                return parent_new(cls)
+            return parent_new(cls, *args, **kw)
         except ValueError:
             raise pyxb.SimpleTypeValueError(cls, args)
         except OverflowError:
@@ -940,8 +1117,18 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         content for a complex type we need the DOM node, but do not want to
         apply the attributes, so we bypass the application.
         """
+        if not kw:
+            # Direct construction from a value; see __new__.
+            args = self._ConvertArguments_vx(args, kw)
+            try:
+                super(simpleTypeDefinition, self).__init__(*args)
+            except OverflowError:
+                raise pyxb.SimpleTypeValueError(type(self), args)
+            if self._validationConfig_.forBinding:
+                self.xsdConstraintsOK()
+            return
         # PyXBFactoryKeywords
-        validate_constraints = kw.pop('_validate_constraints', self._validationConfig.forBinding)
+        validate_constraints = kw.pop('_validate_constraints', self._validationConfig_.forBinding)
         require_value = kw.pop('_require_value', False)
         # Save DOM node so we can pull attributes off it
         dom_node = kw.get('_dom_node')
@@ -1014,12 +1201,19 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
             return ''
         return self.XsdLiteral(self)
 
+    # Map from a PST class to its XsdSuperType.  The value may be None, so
+    # presence is tested with the key.
+    __XsdSuperTypeMap = { }
     @classmethod
     def XsdSuperType (cls):
         """Find the nearest parent class in the PST hierarchy.
 
         The value for anySimpleType is None; for all others, it's a
         primitive or derived PST descendent (including anySimpleType)."""
+        try:
+            return cls.__XsdSuperTypeMap[cls]
+        except KeyError:
+            pass
         for sc in cls.mro():
             if sc == cls:
                 continue
@@ -1027,10 +1221,15 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
                 # If we hit the PST base, this is a primitive type or
                 # otherwise directly descends from a Python type; return
                 # the recorded XSD supertype.
-                return cls._XsdBaseType
+                rv = cls._XsdBaseType
+                break
             if issubclass(sc, simpleTypeDefinition):
-                return sc
-        raise pyxb.LogicError('No supertype found for %s' % (cls,))
+                rv = sc
+                break
+        else:
+            raise pyxb.LogicError('No supertype found for %s' % (cls,))
+        cls.__XsdSuperTypeMap[cls] = rv
+        return rv
 
     @classmethod
     def _XsdConstraintsPreCheck_vb (cls, value):
@@ -1041,13 +1240,50 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         list are acceptable, and for token descendents, to check the
         lexical/value space conformance of the input.
         """
-        super_fn = getattr(super(simpleTypeDefinition, cls), '_XsdConstraintsPreCheck_vb', lambda *a,**kw: value)
+        super_fn = _NextCooperative(simpleTypeDefinition, cls, '_XsdConstraintsPreCheck_vb')
+        if super_fn is None:
+            return value
         return super_fn(value)
 
     # Cache of pre-computed sequences of class facets in the order required
     # for constraint validation
     __ClassFacetSequence = { }
 
+    @classmethod
+    def __ClassFacetSequenceFor (cls):
+        """Return the sequence of facets that constrain values of this class.
+
+        The result is cached for the class unless some class in
+        the hierarchy does not yet have its facet map."""
+        # Constraints for simple type definitions are inherited.  Check them
+        # from least derived to most derived.
+        classes = [ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]
+        classes.reverse()
+        cache_result = True
+        facet_values = []
+        seen = set()
+        for clazz in classes:
+            # When setting up the datatypes, if we attempt to validate
+            # something before the facets have been initialized (e.g., a
+            # nonNegativeInteger used as a length facet for the parent
+            # integer datatype), just ignore that for now.  Don't cache
+            # the value, though, since a subsequent check after
+            # initialization should succceed.
+            try:
+                clazz_facets = clazz._FacetMap().values()
+            except AttributeError:
+                cache_result = False
+                continue
+            for v in clazz_facets:
+                # Facets compare by identity
+                if not (id(v) in seen):
+                    seen.add(id(v))
+                    facet_values.append(v)
+        facet_values = tuple(facet_values)
+        if cache_result:
+            cls.__ClassFacetSequence[cls] = facet_values
+        return facet_values
+
     @classmethod
     def XsdConstraintsOK (cls, value, location=None):
         """Validate the given value against the constraints on this class.
@@ -1056,36 +1292,25 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         """
 
         value = cls._XsdConstraintsPreCheck_vb(value)
+        f = cls.__ViolatedFacet(value)
+        if f is not None:
+            raise pyxb.SimpleFacetValueError(cls, value, f, location)
+        return value
 
+    @classmethod
+    def __ViolatedFacet (cls, value):
+        """Return the first facet of this class that C{value} does not
+        satisfy, or C{None} if it satisfies them all.
+
+        C{value} must already have been through
+        L{_XsdConstraintsPreCheck_vb}."""
         facet_values = cls.__ClassFacetSequence.get(cls)
         if facet_values is None:
-            # Constraints for simple type definitions are inherited.  Check them
-            # from least derived to most derived.
-            classes = [ _x for _x in cls.mro() if issubclass(_x, simpleTypeDefinition) ]
-            classes.reverse()
-            cache_result = True
-            facet_values = []
-            for clazz in classes:
-                # When setting up the datatypes, if we attempt to validate
-                # something before the facets have been initialized (e.g., a
-                # nonNegativeInteger used as a length facet for the parent
-                # integer datatype), just ignore that for now.  Don't cache
-                # the value, though, since a subsequent check after
-                # initialization should succceed.
-                try:
-                    clazz_facets = list(six.itervalues(clazz._FacetMap()))
-                except AttributeError:
-                    cache_result = False
-                    clazz_facets = []
-                for v in clazz_facets:
-                    if not (v in facet_values):
-                        facet_values.append(v)
-            if cache_result:
-                cls.__ClassFacetSequence[cls] = facet_values
+            facet_values = cls.__ClassFacetSequenceFor()
         for f in facet_values:
             if not f.validateConstraint(value):
-                raise pyxb.SimpleFacetValueError(cls, value, f, location)
-        return value
+                return f
+        return None
 
     def xsdConstraintsOK (self, location=None):
         """Validate the value of this instance against its constraints."""
@@ -1113,9 +1338,10 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         an instance of a type that does not support length calculations.
         """
         assert isinstance(value, cls)
-        if not hasattr(cls, '_XsdValueLength_vx'):
+        length_fn = getattr(cls, '_XsdValueLength_vx', None)
+        if length_fn is None:
             raise pyxb.LogicError('Class %s does not support length validation' % (cls.__name__,))
-        return cls._XsdValueLength_vx(value)
+        return length_fn(value)
 
     def xsdValueLength (self):
         """Return the length of this instance within its value space.
@@ -1127,10 +1353,9 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     def PythonLiteral (cls, value):
         """Return a string which can be embedded into Python source to
         represent the given value as an instance of this class."""
-        class_name = cls.__name__
         if issubclass(cls, _RepresentAsXsdLiteral_mixin):
             value = value.xsdLiteral()
-        return '%s(%s)' % (class_name, pyxb.utils.utility.repr2to3(value))
+        return cls.__name__ + '(' + utility.repr2to3(value) + ')'
 
     def pythonLiteral (self):
         """Return a string which can be embedded into Python source to
@@ -1140,7 +1365,10 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
     def _toDOM_csc (self, dom_support, parent):
         assert parent is not None
         dom_support.appendTextChild(self, parent)
-        return getattr(super(simpleTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+        next_csc = _NextCooperative(simpleTypeDefinition, type(self), '_toDOM_csc')
+        if next_csc is None:
+            return dom_support
+        return next_csc(self, dom_support, parent)
 
     @classmethod
     def _IsSimpleTypeContent (cls):
@@ -1148,9 +1376,13 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         return True
 
     @classmethod
-    def _IsValidValue (self, value):
+    def _IsValidValue (cls, value):
         try:
-            self._CheckValidValue(value)
+            if cls._CheckValidValue.__func__ is simpleTypeDefinition._CheckValidValue.__func__:
+                # Without a specialized check, failure can be detected
+                # without raising.  This matters when probing union members.
+                return cls.__ValidateValue(value, False)
+            cls._CheckValidValue(value)
             return True
         except pyxb.PyXBException:
             pass
@@ -1164,28 +1396,55 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
         correct item type.  This is permitted because only with lists is it
         possible to bypass the normal content validation (by invoking
         append/extend on the list instance)."""
+        cls.__ValidateValue(value, True)
+
+    @classmethod
+    def __ValidateValue (cls, value, raise_error):
+        """Check C{value} as described in L{_CheckValidValue}.
+
+        @param raise_error: If C{True}, an invalid value raises the
+        appropriate L{pyxb.SimpleTypeValueError}.  If C{False}, no exception
+        is created for it and C{False} is returned instead.
+
+        @return: C{True} if the value is valid."""
         if value is None:
-            raise pyxb.SimpleTypeValueError(cls, value)
+            if raise_error:
+                raise pyxb.SimpleTypeValueError(cls, value)
+            return False
         value_class = cls
-        if issubclass(cls, STD_list):
+        variety = cls._Variety
+        if cls._VARIETY_list == variety:
             if not isinstance(value, Iterable):
-                raise pyxb.SimpleTypeValueError(cls, value)
+                if raise_error:
+                    raise pyxb.SimpleTypeValueError(cls, value)
+                return False
             for v in value:
                 if not cls._ItemType._IsValidValue(v):
-                    raise pyxb.SimpleListValueError(cls, v)
-        else:
-            if issubclass(cls, STD_union):
+                    if raise_error:
+                        raise pyxb.SimpleListValueError(cls, v)
+                    return False
+        elif type(value) is not cls:
+            # An instance of exactly this class needs only the constraint
+            # check (union classes have no instances of their own).
+            if cls._VARIETY_union == variety:
                 value_class = None
                 for mt in cls._MemberTypes:
                     if mt._IsValidValue(value):
                         value_class = mt
                         break
                 if value_class is None:
-                    raise pyxb.SimpleUnionValueError(cls, value)
+                    if raise_error:
+                        raise pyxb.SimpleUnionValueError(cls, value)
+                    return False
             #if not (isinstance(value, value_class) or issubclass(value_class, type(value))):
             if not isinstance(value, value_class):
-                raise pyxb.SimpleTypeValueError(cls, value)
-        value_class.XsdConstraintsOK(value)
+                if raise_error:
+                    raise pyxb.SimpleTypeValueError(cls, value)
+                return False
+        if raise_error:
+            value_class.XsdConstraintsOK(value)
+            return True
+        return value_class.__ViolatedFacet(value_class._XsdConstraintsPreCheck_vb(value)) is None
 
     def _checkValidValue (self):
         self._CheckValidValue(self)
@@ -1201,10 +1460,25 @@ class simpleTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin
 
     @classmethod
     def _description (cls, name_only=False, user_documentation=True):
-        name = cls._Name()
         if name_only:
-            return name
-        desc = [ name, ' restriction of ', cls.XsdSuperType()._description(name_only=True) ]
+            return cls._Name()
+        # Descriptions are derived from class metadata only, so are cached.
+        key = (cls, user_documentation)
+        rv = cls.__DescriptionMap.get(key)
+        if rv is None:
+            rv = cls.__DescriptionMap[key] = cls._Description_vx(user_documentation)
+        return rv
+
+    # Map from (class, user_documentation) to the full description of the
+    # class.
+    __DescriptionMap = { }
+
+    @classmethod
+    def _Description_vx (cls, user_documentation):
+        """Return the full (not name-only) L{_description} of the class.
+
+        Subclasses for each simple type variety override this."""
+        desc = [ cls._Name(), ' restriction of ', cls.XsdSuperType()._description(name_only=True) ]
         if user_documentation and (cls._Documentation is not None):
             desc.extend(["\n", cls._Documentation])
         return ''.join(desc)
@@ -1229,6 +1503,8 @@ class STD_union (simpleTypeDefinition):
     # @todo Ensure that pattern and enumeration are valid constraints
     __FacetMap = {}
 
+    _Variety = simpleTypeDefinition._VARIETY_union
+
     @classmethod
     def Factory (cls, *args, **kw):
         """Given a value, attempt to create an instance of some member of this
@@ -1242,12 +1518,13 @@ class STD_union (simpleTypeDefinition):
         an instance from the parameters in C{args} and C{kw}.
         """
 
-        used_cls = cls._SupersedingClass()
+        # Inline _DynamicCreate_mixin._SupersedingClass
+        used_cls = cls.__dict__.get('_DynamicCreate_mixin__SupersedingClass', cls)
         state = used_cls._PreFactory_vx(args, kw)
 
         rv = None
         # NB: get, not pop: preserve it for the member type invocations
-        validate_constraints = kw.get('_validate_constraints', cls._GetValidationConfig().forBinding)
+        validate_constraints = kw.get('_validate_constraints', cls._validationConfig_.forBinding)
         assert isinstance(validate_constraints, bool)
         if 0 < len(args):
             arg = args[0]
@@ -1258,14 +1535,12 @@ class STD_union (simpleTypeDefinition):
         if rv is None:
             kw['_validate_constraints'] = True
             for mt in cls._MemberTypes:
+                # Any failure to create a member value means try the next
+                # member; but do not swallow KeyboardInterrupt or SystemExit.
                 try:
                     rv = mt.Factory(*args, **kw)
                     break
-                except pyxb.SimpleTypeValueError:
-                    pass
-                except (ValueError, OverflowError):
-                    pass
-                except:
+                except Exception:
                     pass
         location = None
         if kw is not None:
@@ -1304,11 +1579,8 @@ class STD_union (simpleTypeDefinition):
         raise pyxb.LogicError('%s: cannot construct instances of union' % (self.__class__.__name__,))
 
     @classmethod
-    def _description (cls, name_only=False, user_documentation=True):
-        name = cls._Name()
-        if name_only:
-            return name
-        desc = [ name, ', union of ']
+    def _Description_vx (cls, user_documentation):
+        desc = [ cls._Name(), ', union of ']
         desc.append(', '.join([ _td._description(name_only=True) for _td in cls._MemberTypes ]))
         return ''.join(desc)
 
@@ -1318,7 +1590,7 @@ class STD_union (simpleTypeDefinition):
         return cls._ValidatedMember(value).xsdLiteral()
 
 
-class STD_list (simpleTypeDefinition, six.list_type):
+class STD_list (simpleTypeDefinition, list):
     """Base class for collection datatypes.
 
     This class descends from the Python list type, and incorporates
@@ -1332,6 +1604,8 @@ class STD_list (simpleTypeDefinition, six.list_type):
     # initialized.  Alternative is to not descend from simpleTypeDefinition.
     __FacetMap = {}
 
+    _Variety = simpleTypeDefinition._VARIETY_list
+
     @classmethod
     def _ValidatedItem (cls, value, kw=None):
         """Verify that the given value is permitted as an item of this list.
@@ -1345,13 +1619,14 @@ class STD_list (simpleTypeDefinition, six.list_type):
         when exceptions must be built.  In particular, C{_location} may be
         useful.
         """
-        if isinstance(value, cls._ItemType):
+        item_type = cls._ItemType
+        if isinstance(value, item_type):
             pass
-        elif issubclass(cls._ItemType, STD_union):
-            value = cls._ItemType._ValidatedMember(value)
+        elif item_type._VARIETY_union == item_type._Variety:
+            value = item_type._ValidatedMember(value)
         else:
             try:
-                value = cls._ItemType(value)
+                value = item_type(value)
             except (pyxb.SimpleTypeValueError, TypeError):
                 location = None
                 if kw is not None:
@@ -1365,73 +1640,69 @@ class STD_list (simpleTypeDefinition, six.list_type):
         # resulting list of tokens.
         if 0 < len(args):
             arg1 = args[0]
-            if isinstance(arg1, six.string_types):
+            if isinstance(arg1, str):
                 args = (arg1.split(),) + args[1:]
                 arg1 = args[0]
             if isinstance(arg1,Iterable):
-                new_arg1 = [ cls._ValidatedItem(_v, kw) for _v in arg1 ]
+                # Items that already have the item type are used as is;
+                # see _ValidatedItem.
+                item_type = cls._ItemType
+                validated_item = cls._ValidatedItem
+                new_arg1 = [ _v if isinstance(_v, item_type) else validated_item(_v, kw) for _v in arg1 ]
                 args = (new_arg1,) + args[1:]
-        super_fn = getattr(super(STD_list, cls), '_ConvertArguments_vx', lambda *a,**kw: args)
+        super_fn = _NextCooperative(STD_list, cls, '_ConvertArguments_vx')
+        if super_fn is None:
+            return args
         return super_fn(args, kw)
 
-    @classmethod
-    def _XsdValueLength_vx (cls, value):
-        return len(value)
+    # The length of a list is the number of items in it.
+    _XsdValueLength_vx = staticmethod(len)
 
     @classmethod
     def XsdLiteral (cls, value):
         """Convert from a binding value to a string usable in an XML document."""
-        return ' '.join([ cls._ItemType.XsdLiteral(_v) for _v in value ])
+        item_literal = cls._ItemType.XsdLiteral
+        return ' '.join([ item_literal(_v) for _v in value ])
 
     @classmethod
-    def _description (cls, name_only=False, user_documentation=True):
-        name = cls._Name()
-        if name_only:
-            return name
-        desc = [ name, ', list of ', cls._ItemType._description(name_only=True) ]
+    def _Description_vx (cls, user_documentation):
+        desc = [ cls._Name(), ', list of ', cls._ItemType._description(name_only=True) ]
         return ''.join(desc)
 
-    # Convert a single value to the required type, if not already an instance
-    @classmethod
-    def __ConvertOne (cls, v):
-        return cls._ValidatedItem(v)
-
-    # Convert a sequence of values to the required type, if not already instances
-    def __convertMany (self, values):
-        return [ self._ValidatedItem(_v) for _v in values ]
+    # The single-item methods below call the list implementation directly.
+    # Nothing between STD_list and list in the MRO overrides them, and this
+    # avoids creating a super proxy on every call.
 
     def __setitem__ (self, key, value):
         if isinstance(key, slice):
-            super(STD_list, self).__setitem__(key, self.__convertMany(value))
+            list.__setitem__(self, key, list(map(self._ValidatedItem, value)))
         else:
-            super(STD_list, self).__setitem__(key, self._ValidatedItem(value))
-
-    if six.PY2:
-        def __setslice__ (self, start, end, values):
-            super(STD_list, self).__setslice__(start, end, self.__convertMany(values))
+            list.__setitem__(self, key, self._ValidatedItem(value))
 
     def __contains__ (self, item):
-        return super(STD_list, self).__contains__(self._ValidatedItem(item))
+        return list.__contains__(self, self._ValidatedItem(item))
 
     # Standard mutable sequence methods, per Python Library Reference "Mutable Sequence Types"
 
     def append (self, x):
-        super(STD_list, self).append(self._ValidatedItem(x))
+        list.append(self, self._ValidatedItem(x))
 
     def extend (self, x, _from_xml=False):
-        super(STD_list, self).extend(self.__convertMany(x))
+        # Validate everything before extending, so a bad item leaves the
+        # list unchanged.
+        list.extend(self, list(map(self._ValidatedItem, x)))
 
     def count (self, x):
-        return super(STD_list, self).count(self._ValidatedItem(x))
+        return list.count(self, self._ValidatedItem(x))
 
     def index (self, x, *args):
-        return super(STD_list, self).index(self._ValidatedItem(x), *args)
+        return list.index(self, self._ValidatedItem(x), *args)
 
     def insert (self, i, x):
-        super(STD_list, self).insert(i, self._ValidatedItem(x))
+        list.insert(self, i, self._ValidatedItem(x))
 
     def remove (self, x):
-        super(STD_list, self).remove(self._ValidatedItem(x))
+        list.remove(self, self._ValidatedItem(x))
 
 class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
     """Class that represents a schema element within a binding.
@@ -1478,6 +1749,20 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         return self.__name
     __name = None
 
+    def __topLevelElement (self):
+        """Return the top-level element binding for this element's name, or
+        C{None} if there is none.
+
+        A successful lookup is remembered, since resolving the name goes
+        through the namespace category maps.  A failed one is not, as the
+        module defining the element may not have been loaded yet."""
+        top_elt = self.__topLevelElementValue
+        if top_elt is None:
+            top_elt = self.__name.elementBinding()
+            self.__topLevelElementValue = top_elt
+        return top_elt
+    __topLevelElementValue = None
+
     def typeDefinition (self):
         """The L{_TypeBinding_mixin} subclass for values of this element."""
         return self.__typeDefinition._SupersedingClass()
@@ -1534,20 +1819,24 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         return self.__substitutionGroup
     def _setSubstitutionGroup (self, substitution_group):
         self.__substitutionGroup = substitution_group
-        if substitution_group is not None:
-            self.substitutesFor = self._real_substitutesFor
+        self.__descriptionMap = None
+        _CTDDescriptionCache.clear()
+        # Invalidates the substitution members cached by every element.
+        element.__SubstitutionGroupGeneration += 1
         return self
     __substitutionGroup = None
 
     def findSubstituendDecl (self, ctd_class):
-        ed = ctd_class._ElementMap.get(self.name())
-        if ed is not None:
-            return ed
-        if self.substitutionGroup() is None:
-            return None
-        return self.substitutionGroup().findSubstituendDecl(ctd_class)
+        element_map = ctd_class._ElementMap
+        elt = self
+        while elt is not None:
+            ed = element_map.get(elt.__name)
+            if ed is not None:
+                return ed
+            elt = elt.__substitutionGroup
+        return None
 
-    def _real_substitutesFor (self, other):
+    def substitutesFor (self, other):
         """Determine whether an instance of this element can substitute for the other element.
 
         See U{Substitution Group OK<http://www.w3.org/TR/xmlschema-1/#cos-equiv-derived-ok-rec>}.
@@ -1555,7 +1844,7 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         @todo: Do something about blocking constraints.  This ignores them, as
         does everything leading to this point.
         """
-        if self.substitutionGroup() is None:
+        if self.__substitutionGroup is None:
             return False
         if other is None:
             return False
@@ -1563,18 +1852,22 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         # On the first call, other is likely to be the local element.  We need
         # the global one.
         if other.scope() is not None:
-            other = other.name().elementBinding()
+            other = other.__topLevelElement()
             if other is None:
                 return False
             assert other.scope() is None
-        # Do both these refer to the same (top-level) element?
-        if self.name().elementBinding() == other:
-            return True
-        return (self.substitutionGroup() == other) or self.substitutionGroup().substitutesFor(other)
-
-    def substitutesFor (self, other):
-        """Stub replaced by _real_substitutesFor when element supports substitution groups."""
-        return False
+        # Walk up the substitution group chain.  At each step: do both these
+        # refer to the same (top-level) element?
+        elt = self
+        while True:
+            if elt.__topLevelElement() == other:
+                return True
+            substitution_group = elt.__substitutionGroup
+            if substitution_group == other:
+                return True
+            elt = substitution_group
+            if elt.__substitutionGroup is None:
+                return False
 
     def memberElement (self, name):
         """Return a reference to the element instance used for the given name
@@ -1614,13 +1907,15 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         @raise pyxb.AbstractElementError: This element is abstract and no DOM
         node was provided.
         """
-        dom_node = kw.pop('_dom_node', None)
-        assert dom_node is None, 'Cannot pass DOM node directly to element constructor; use createFromDOM'
-        if '_element' in kw:
-            raise pyxb.LogicError('Cannot set _element in element-based instance creation')
+        dom_node = None
+        if kw:
+            dom_node = kw.pop('_dom_node', None)
+            assert dom_node is None, 'Cannot pass DOM node directly to element constructor; use createFromDOM'
+            if '_element' in kw:
+                raise pyxb.LogicError('Cannot set _element in element-based instance creation')
         kw['_element'] = self
         # Can't create instances of abstract elements.
-        if self.abstract():
+        if self.__abstract:
             location = kw.get('_location')
             if (location is None) and isinstance(dom_node, utility.Locatable_mixin):
                 location = dom_node._location()
@@ -1634,7 +1929,9 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
                 if 1 < len(args):
                     raise ValueError(*args)
                 args = [ self.compatibleValue(args[0], **kw) ]
-        rv = self.typeDefinition().Factory(*args, **kw)
+        # Resolve the superseding class here rather than caching it, since
+        # it may be changed after the element is created.
+        rv = self.__typeDefinition._SupersedingClass().Factory(*args, **kw)
         rv._setElement(self)
         return rv
 
@@ -1653,8 +1950,13 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         if is_plural:
             if not isinstance(value, Iterable):
                 raise pyxb.SimplePluralValueError(self.typeDefinition(), value)
-            return [ self.compatibleValue(_v) for _v in value ]
-        compValue = self.typeDefinition()._CompatibleValue(value, **kw);
+            return list(map(self.compatibleValue, value))
+        type_definition = self.__typeDefinition._SupersedingClass()
+        # An instance of exactly the element's type is returned unchanged by
+        # the checks below, unless the element is fixed or abstract.
+        if (type(value) is type_definition) and not (self.__fixed or self.__abstract):
+            return value
+        compValue = type_definition._CompatibleValue(value, **kw);
         if self.__fixed and (compValue != self.__defaultValue):
             raise pyxb.ElementChangeError(self, value)
         if isinstance(value, _TypeBinding_mixin) and (value._element() is not None) and value._element().substitutesFor(self):
@@ -1718,7 +2020,9 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         # namespace context; if the user cared, she should have assigned a
         # context before calling this.
         ns_ctx = pyxb.namespace.NamespaceContext.GetNodeContext(node)
-        (did_replace, type_class) = XSI._InterpretTypeAttribute(XSI.type.getAttribute(node), ns_ctx, fallback_namespace, type_class)
+        xsi_type = _GetXSITypeAttribute(node)
+        if xsi_type is not None:
+            (did_replace, type_class) = XSI._InterpretTypeAttribute(xsi_type, ns_ctx, fallback_namespace, type_class)
 
         if type_class is None:
             raise pyxb.UnrecognizedDOMRootNodeError(node)
@@ -1726,7 +2030,7 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         # Pass xsi:nil on to the constructor regardless of whether the element
         # is nillable.  Another sop to SOAP-encoding WSDL fans who don't
         # bother to provide valid schema for their message content.
-        is_nil = XSI.nil.getAttribute(node)
+        is_nil = _GetXSINilAttribute(node)
         if is_nil is not None:
             kw['_nil'] = pyxb.binding.datatypes.boolean(is_nil)
 
@@ -1736,7 +2040,10 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         finally:
             pyxb.namespace.NamespaceContext.PopContext()
         assert rv._element() == element_binding
-        rv._setNamespaceContext(pyxb.namespace.NamespaceContext.GetNodeContext(node))
+        # GetNodeContext above either found or attached the context for node,
+        # so it can be used again here.
+        assert ns_ctx is pyxb.namespace.NamespaceContext.GetNodeContext(node)
+        rv._setNamespaceContext(ns_ctx)
         return rv._postDOMValidate()
 
     # element
@@ -1778,9 +2085,18 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         # Name match means OK.
         if self.name() == name:
             return self
+        # Substitution group members that have already been found, unless a
+        # substitution group has changed since they were.
+        if self.__substitutionMembers is not None:
+            if self.__substitutionMembersGeneration == element.__SubstitutionGroupGeneration:
+                named_elt = self.__substitutionMembers.get(name)
+                if named_elt is not None:
+                    return named_elt
+            else:
+                self.__substitutionMembers = None
         # No name match means only hope is a substitution group, for which the
         # element must be top-level.
-        top_elt = self.name().elementBinding()
+        top_elt = self.__topLevelElement()
         if top_elt is None:
             return None
         # Members of the substitution group must also be top-level.  NB: If
@@ -1793,8 +2109,19 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         if (named_elt is None) or (named_elt == top_elt):
             return None
         if named_elt.substitutesFor(top_elt):
+            # Only successes are remembered: a member may not be known until
+            # the module defining it has been loaded.
+            if self.__substitutionMembers is None:
+                self.__substitutionMembers = {}
+                self.__substitutionMembersGeneration = element.__SubstitutionGroupGeneration
+            self.__substitutionMembers[name] = named_elt
             return named_elt
         return None
+    __substitutionMembers = None
+    __substitutionMembersGeneration = None
+
+    # Incremented whenever any element's substitution group is set.
+    __SubstitutionGroupGeneration = 0
 
     def createFromDOM (self, node, fallback_namespace=None, **kw):
         """Create an instance of this element using a DOM node as the source
@@ -1828,9 +2155,9 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
         This method does minimal processing of C{node} and C{expanded_name}
         and delegates to L{CreateDOMBinding}.
 
-        @param node: An C{xml.dom.Node} representing a root element.  If the
-        node is a document, that document's root node will be substituted.
-        The value is passed to L{CreateDOMBinding}.
+        @param node: An C{xml.dom.Node} representing a root element.  This
+        must be an element node; use L{createFromDOM} to start from a
+        document.  The value is passed to L{CreateDOMBinding}.
 
         @param expanded_name: The expanded name of the element to be used for
         content.  This is passed to L{elementForName} to obtain the binding
@@ -1842,18 +2169,32 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
 
         @return: As with L{CreateDOMBinding}.
         """
-        if xml.dom.Node.DOCUMENT_NODE == node.nodeType:
-            node = node.documentElement
         return element.CreateDOMBinding(node, self.elementForName(expanded_name), **kw)
 
     def __str__ (self):
         return 'Element %s' % (self.name(),)
 
     def _description (self, name_only=False, user_documentation=True):
-        name = six.text_type(self.name())
+        name = str(self.name())
         if name_only:
             return name
-        desc = [ name, ' (', self.typeDefinition()._description(name_only=True), ')' ]
+        # The superseding type class may change after the element is created,
+        # so it is part of the key.
+        type_definition = self.typeDefinition()
+        key = (type_definition, user_documentation)
+        if self.__descriptionMap is None:
+            self.__descriptionMap = { }
+        rv = self.__descriptionMap.get(key)
+        if rv is None:
+            rv = self.__descriptionMap[key] = self.__description(name, type_definition, user_documentation)
+        return rv
+
+    # Map from (type definition, user_documentation) to the full description
+    # of the element.  Reset when the substitution group changes.
+    __descriptionMap = None
+
+    def __description (self, name, type_definition, user_documentation):
+        desc = [ name, ' (', type_definition._description(name_only=True), ')' ]
         if self.scope() is not None:
             desc.extend([', local to ', self.scope()._description(name_only=True) ])
         if self.nillable():
@@ -1862,32 +2203,32 @@ class element (utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
             desc.extend([', substitutes for ', self.substitutionGroup()._description(name_only=True) ])
         if user_documentation and (self.documentation() is not None):
             desc.extend(["\n", self.documentation() ])
-        return six.u('').join(desc)
+        return ''.join(desc)
 
 class enumeration_mixin (pyxb.cscRoot):
     """Marker in case we need to know that a PST has an enumeration constraint facet."""
 
-    _ReservedSymbols = set([ 'itervalues', 'values', 'iteritems', 'items' ])
+    _ReservedSymbols = frozenset([ 'itervalues', 'values', 'iteritems', 'items' ])
 
     @classmethod
     def itervalues (cls):
         """Return a generator for the values that the enumeration can take."""
-        return six.itervalues(cls._CF_enumeration)
+        return cls._CF_enumeration.itervalues()
 
     @classmethod
     def values (cls):
         """Return a list of values that the enumeration can take."""
-        return list(cls.itervalues()) # nosix
+        return cls._CF_enumeration.values()
 
     @classmethod
     def iteritems (cls):
         """Generate the associated L{pyxb.binding.facet._EnumerationElement} instances."""
-        return six.iteritems(cls._CF_enumeration)
+        return cls._CF_enumeration.iteritems()
 
     @classmethod
     def items (cls):
         """Return the associated L{pyxb.binding.facet._EnumerationElement} instances."""
-        return list(cls.iteritems()) # nosix
+        return cls._CF_enumeration.items()
 
     @classmethod
     def _elementForValue (cls, value):
@@ -1906,13 +2247,16 @@ class enumeration_mixin (pyxb.cscRoot):
 class _Content (object):
     """Base for any wrapper added to L{complexTypeDefinition.orderedContent}."""
 
+    # One of these is created for every item of content in a document, so
+    # avoid giving each a dictionary.
+    __slots__ = ('__value',)
+
     def __getValue (self):
         """The value of the content.
 
         This is a unicode string for L{NonElementContent}, and (ideally) an
         instance of L{_TypeBinding_mixin} for L{ElementContent}."""
         return self.__value
-    __value = None
     value = property(__getValue)
 
     @classmethod
@@ -1927,21 +2271,11 @@ class _Content (object):
         Thus the catenated text of the non-element content of an instance can
         be obtained with::
 
-           text = six.u('').join(NonElementContent.ContentIterator(instance.orderedContent()))
+           text = ''.join(NonElementContent.ContentIterator(instance.orderedContent()))
 
         See also L{pyxb.NonElementContent}
         """
-        class _Iterator (six.Iterator):
-            def __init__ (self, input):
-                self.__input = iter(input)
-            def __iter__ (self):
-                return self
-            def __next__ (self):
-                while True:
-                    content = next(self.__input)
-                    if isinstance(content, cls):
-                        return content.value
-        return _Iterator(input)
+        return map(operator.attrgetter('value'), filter(lambda _c: isinstance(_c, cls), input))
 
     def __init__ (self, value):
         self.__value = value
@@ -1951,11 +2285,12 @@ class ElementContent (_Content):
 
     The value should be translated into XML and made a child of its parent."""
 
+    __slots__ = ('__elementDeclaration',)
+
     def __getElementDeclaration (self):
         """The L{pyxb.binding.content.ElementDeclaration} associated with the element content.
         This may be C{None} if the value is a wildcard."""
         return self.__elementDeclaration
-    __elementDeclaration = None
 
     elementDeclaration = property(__getElementDeclaration)
 
@@ -1981,7 +2316,6 @@ class ElementContent (_Content):
         @keyword tag: Alternative path to providing C{element_declaration}
         """
 
-        import pyxb.binding.content
         super(ElementContent, self).__init__(value)
         if instance is not None:
             if not isinstance(instance, complexTypeDefinition):
@@ -1995,8 +2329,11 @@ class NonElementContent (_Content):
 
     The value will be unicode text, and should be appended as character
     data."""
+
+    __slots__ = ()
+
     def __init__ (self, value):
-        super(NonElementContent, self).__init__(six.text_type(value))
+        super(NonElementContent, self).__init__(str(value))
 
 class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixin, _DynamicCreate_mixin):
     """Base for any Python class that serves as the binding for an
@@ -2012,6 +2349,11 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     _CT_MIXED = 'MIXED'                 #<<< Children may be elements or other (e.g., character) content
     _CT_ELEMENT_ONLY = 'ELEMENT_ONLY'   #<<< Expect only element content.
 
+    # Groupings of the tags above used to test for a category of content.
+    __NonComplexContentTags = (_CT_EMPTY, _CT_SIMPLE)
+    __ComplexContentTags = (_CT_MIXED, _CT_ELEMENT_ONLY)
+    __NoTextContentTags = (_CT_EMPTY, _CT_ELEMENT_ONLY)
+
     _ContentTypeTag = None
 
     _TypeDefinition = None
@@ -2100,7 +2442,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             if xml.dom.Node.DOCUMENT_NODE == dom_node.nodeType:
                 dom_node = dom_node.documentElement
             #kw['_validate_constraints'] = False
-            is_nil = XSI.nil.getAttribute(dom_node)
+            is_nil = _GetXSINilAttribute(dom_node)
             if is_nil is not None:
                 is_nil = kw['_nil'] = pyxb.binding.datatypes.boolean(is_nil)
         if location is not None:
@@ -2115,11 +2457,14 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         self.reset()
         self._setAttributesFromKeywordsAndDOM(kw, dom_node)
         did_set_kw_elt = False
-        for fu in six.itervalues(self._ElementMap):
-            iv = kw.pop(fu.id(), None)
-            if iv is not None:
-                did_set_kw_elt = True
-                fu.set(self, iv)
+        # Only walk the elements if some keyword names one.  The walk is in
+        # element map order, which determines the order of the content.
+        if kw and not self.__ElementIds().isdisjoint(kw):
+            for (fu_id, fu) in self.__ElementUseIds():
+                iv = kw.pop(fu_id, None)
+                if iv is not None:
+                    did_set_kw_elt = True
+                    fu.set(self, iv)
         if do_finalize_content_model is None:
             do_finalize_content_model = not did_set_kw_elt
         if kw and kw.pop('_strict_keywords', True):
@@ -2135,7 +2480,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             if value._constructedWithValue():
                 self.append(value)
         elif dom_node is not None:
-            self.extend(dom_node.childNodes[:], fallback_namespace)
+            self.extend(dom_node.childNodes, fallback_namespace)
         else:
             do_finalize_content_model = False
         if do_finalize_content_model:
@@ -2149,6 +2494,50 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     # the content model for the type.
     _Automaton = None
 
+    @classmethod
+    def __ElementUses (cls):
+        """Return a tuple of the L{content.ElementDeclaration} values in
+        L{_ElementMap}.
+
+        The tuple is computed on first use and cached on the class.  It is
+        recomputed if the size of the element map changes, which happens
+        only while the binding class is being constructed."""
+        rv = cls.__dict__.get('_complexTypeDefinition__elementUses')
+        if (rv is None) or (len(rv) != len(cls._ElementMap)):
+            rv = tuple(cls._ElementMap.values())
+            cls.__elementUses = rv
+        return rv
+
+    @classmethod
+    def __ElementUseIds (cls):
+        """Return a tuple of C{(id, element_use)} pairs for the members of
+        L{_ElementMap}, cached as with L{__ElementUses}."""
+        rv = cls.__dict__.get('_complexTypeDefinition__elementUseIds')
+        if (rv is None) or (len(rv) != len(cls._ElementMap)):
+            rv = tuple( (_eu.id(), _eu) for _eu in cls._ElementMap.values() )
+            cls.__elementUseIds = rv
+        return rv
+
+    @classmethod
+    def __ElementIds (cls):
+        """Return a frozenset of the ids of the members of L{_ElementMap},
+        cached as with L{__ElementUses}."""
+        rv = cls.__dict__.get('_complexTypeDefinition__elementIds')
+        if (rv is None) or (len(rv) != len(cls._ElementMap)):
+            rv = frozenset( _eu.id() for _eu in cls._ElementMap.values() )
+            cls.__elementIds = rv
+        return rv
+
+    @classmethod
+    def __AttributeUses (cls):
+        """Return a tuple of the L{content.AttributeUse} values in
+        L{_AttributeMap}, cached as with L{__ElementUses}."""
+        rv = cls.__dict__.get('_complexTypeDefinition__attributeUses')
+        if (rv is None) or (len(rv) != len(cls._AttributeMap)):
+            rv = tuple(cls._AttributeMap.values())
+            cls.__attributeUses = rv
+        return rv
+
     @classmethod
     def _AddElement (cls, element):
         """Method used by generated code to associate the element binding with a use in this type.
@@ -2181,7 +2570,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         disabled validation.  Consequently, it may not generate valid XML.
         """
         order = []
-        for ed in six.itervalues(self._ElementMap):
+        for ed in self.__ElementUses():
             value = ed.value(self)
             if value is None:
                 continue
@@ -2206,7 +2595,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
         @return: C{None} or a list as described above.
         """
-        if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
+        if self._ContentTypeTag in self.__NonComplexContentTags:
             return []
         self._resetAutomaton()
         return self.__automatonConfiguration.sequencedChildren()
@@ -2231,14 +2620,14 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         content to the binding declaration type.
         """
         rv = { }
-        for eu in six.itervalues(self._ElementMap):
+        for eu in self.__ElementUses():
             value = eu.value(self)
             if value is None:
                 continue
             converter = eu.elementBinding().compatibleValue
             if eu.isPlural():
                 if 0 < len(value):
-                    rv[eu] = [ converter(_v) for _v in value ]
+                    rv[eu] = list(map(converter, value))
             else:
                 rv[eu] = [ converter(value)]
         wce = self.__wildcardElements
@@ -2247,7 +2636,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         return rv
 
     def _validateAttributes (self):
-        for au in six.itervalues(self._AttributeMap):
+        for au in self.__AttributeUses():
             au.validate(self)
 
     def _validateBinding_vx (self):
@@ -2269,13 +2658,15 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         return True
 
     def _setAttribute (self, attr_en, value_lex):
-        au = self._AttributeMap.get(attr_en)
-        if au is None:
+        # Attributes are almost always declared, so optimize for the hit.
+        try:
+            au = self._AttributeMap[attr_en]
+        except KeyError:
             if self._AttributeWildcard is None:
                 raise pyxb.UnrecognizedAttributeError(type(self), attr_en, self)
             self.__wildcardAttributeMap[attr_en] = value_lex
-        else:
-            au.set(self, value_lex, from_xml=True)
+            return None
+        au.set(self, value_lex, from_xml=True)
         return au
 
     def xsdConstraintsOK (self, location=None):
@@ -2336,7 +2727,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
         @raise pyxb.NotComplexContentError: this is not a complex type with mixed or element-only content
         """
-        if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
+        if self._ContentTypeTag in self.__NonComplexContentTags:
             raise pyxb.NotComplexContentError(self)
         return self.__content
 
@@ -2357,7 +2748,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
         @deprecated: use L{orderedContent}."""
         self.__WarnOnContent()
-        if self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE):
+        if self._ContentTypeTag in self.__NonComplexContentTags:
             raise pyxb.NotComplexContentError(self)
         return [ _v.value for _v in self.__content ]
 
@@ -2385,24 +2776,24 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             if not isinstance(value, self._TypeDefinition):
                 value = self._TypeDefinition.Factory(value)
             self.__setContent(value)
-            if self._validationConfig.forBinding:
+            if self._validationConfig_.forBinding:
                 self.xsdConstraintsOK(location)
         return self
 
     def _resetContent (self, reset_elements=False):
         if reset_elements:
-            for eu in six.itervalues(self._ElementMap):
+            for eu in self.__ElementUses():
                 eu.reset(self)
         nv = None
-        if self._ContentTypeTag in (self._CT_MIXED, self._CT_ELEMENT_ONLY):
+        if self._ContentTypeTag in self.__ComplexContentTags:
             nv = []
-        return self.__setContent(nv)
+        self.__content = nv
+        return nv
 
     __automatonConfiguration = None
     def _resetAutomaton (self):
         if self._Automaton is not None:
             if self.__automatonConfiguration is None:
-                import pyxb.binding.content
                 self.__automatonConfiguration = pyxb.binding.content.AutomatonConfiguration(self)
             self.__automatonConfiguration.reset()
         return self.__automatonConfiguration
@@ -2424,9 +2815,11 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         """
 
         self._resetContent(reset_elements=True)
-        for au in six.itervalues(self._AttributeMap):
+        for au in self.__AttributeUses():
             au.reset(self)
-        self._resetAutomaton()
+        # Without a content model there is no automaton to reset.
+        if self._Automaton is not None:
+            self._resetAutomaton()
         return self
 
     @classmethod
@@ -2456,17 +2849,30 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         @return: C{( element_binding, element_decl )}
         """
         element_decl = cls._ElementMap.get(element_name)
-        element_binding = None
-        if element_decl is None:
+        if element_decl is not None:
+            return (element_decl.elementBinding(), element_decl)
+        # Not a local element: resolving the name as a global element is
+        # comparatively expensive, so successful resolutions are remembered.
+        # Failures are not, since the module defining the element may not
+        # have been loaded yet.
+        key = (cls, element_name)
+        rv = cls.__ElementBindingDeclMap.get(key)
+        if rv is None:
+            element_binding = None
             try:
                 element_binding = element_name.elementBinding()
             except pyxb.NamespaceError:
                 pass
-            if element_binding is not None:
-                element_decl = element_binding.findSubstituendDecl(cls)
-        else:
-            element_binding = element_decl.elementBinding()
-        return (element_binding, element_decl)
+            if element_binding is None:
+                return (None, None)
+            rv = (element_binding, element_binding.findSubstituendDecl(cls))
+            cls.__ElementBindingDeclMap[key] = rv
+        return rv
+
+    # Map from (class, expanded name) to the result of
+    # _ElementBindingDeclForName, for names that are not in the class's
+    # element map but resolve to a global element.
+    __ElementBindingDeclMap = { }
 
     def append (self, value, **kw):
         """Add the value to the instance.
@@ -2484,15 +2890,18 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         element_decl = kw.get('_element_decl', None)
         maybe_element = kw.get('_maybe_element', True)
         location = kw.get('_location', None)
+        # Nil instances accept no content, so below here the instance is
+        # known not to be nil.
         if self._isNil():
             raise pyxb.ContentInNilInstanceError(self, value, location)
+        content_type_tag = self._ContentTypeTag
+        automaton_configuration = self.__automatonConfiguration
         fallback_namespace = kw.get('_fallback_namespace', None)
-        require_validation = kw.get('_require_validation', self._validationConfig.forBinding)
+        require_validation = kw.get('_require_validation', self._validationConfig_.forBinding)
         from_xml = kw.get('_from_xml', False)
         element_binding = None
         if element_decl is not None:
-            from pyxb.binding import content
-            assert isinstance(element_decl, content.ElementDeclaration)
+            assert isinstance(element_decl, pyxb.binding.content.ElementDeclaration)
             element_binding = element_decl.elementBinding()
             assert element_binding is not None
         # Convert the value if it's XML and we recognize it.
@@ -2502,16 +2911,17 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
             assert element_binding is None
             node = value
             require_validation = pyxb.GlobalValidationConfig.forBinding
-            if xml.dom.Node.COMMENT_NODE == node.nodeType:
+            node_type = node.nodeType
+            if node_type in _TextNodeTypes:
+                value = node.data
+                maybe_element = False
+            elif xml.dom.Node.COMMENT_NODE == node_type:
                 # @todo: Note that we're allowing comments inside the bodies
                 # of simple content elements, which isn't really Hoyle.
                 return self
-            if node.nodeType in (xml.dom.Node.TEXT_NODE, xml.dom.Node.CDATA_SECTION_NODE):
-                value = node.data
-                maybe_element = False
             else:
                 # Do type conversion here
-                assert xml.dom.Node.ELEMENT_NODE == node.nodeType
+                assert xml.dom.Node.ELEMENT_NODE == node_type
                 expanded_name = pyxb.namespace.ExpandedName(node, fallback_namespace=fallback_namespace)
                 (element_binding, element_decl) = self._ElementBindingDeclForName(expanded_name)
                 if element_binding is not None:
@@ -2522,7 +2932,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                     # If we don't have an element binding, we might still be
                     # able to convert this if it has an xsi:type attribute
                     # that names a valid type.
-                    xsi_type = XSI.type.getAttribute(node)
+                    xsi_type = _GetXSITypeAttribute(node)
                     try_create = False
                     if xsi_type is not None:
                         ns_ctx = pyxb.namespace.NamespaceContext.GetNodeContext(node)
@@ -2531,10 +2941,10 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                         value = element.CreateDOMBinding(node, None, _fallback_namespace=fallback_namespace)
                     else:
                         _log.warning('Unable to convert DOM node %s at %s to binding', expanded_name, getattr(node, 'location', '[UNAVAILABLE]'))
-        if (not maybe_element) and isinstance(value, six.string_types) and (self._ContentTypeTag in (self._CT_EMPTY, self._CT_ELEMENT_ONLY)):
-            if (0 == len(value.strip())) and not self._isNil():
+        if (not maybe_element) and isinstance(value, str) and (content_type_tag in self.__NoTextContentTags):
+            if 0 == len(value.strip()):
                 return self
-        if maybe_element and (self.__automatonConfiguration is not None):
+        if maybe_element and (automaton_configuration is not None):
             # Allows element content.
             if not require_validation:
                 if element_decl is not None:
@@ -2545,7 +2955,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                     return self
                 raise pyxb.StructuralBadDocumentError(container=self, content=value)
             # Attempt to place the value based on the content model
-            num_cand = self.__automatonConfiguration.step(value, element_decl)
+            num_cand = automaton_configuration.step(value, element_decl)
             if 1 <= num_cand:
                 # Resolution was successful (possibly non-deterministic)
                 return self
@@ -2562,34 +2972,35 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
         # accepts mixed content or has simple content, technically we
         # could convert the value to text and use it.  So that's not
         # element content.
+        is_simple_content = self._CT_SIMPLE == content_type_tag
+        is_mixed = self._CT_MIXED == content_type_tag
         if ((element_binding is not None)
-            or isinstance(value, (xml.dom.Node, complexTypeDefinition, pyxb.BIND))
-            or (isinstance(value, simpleTypeDefinition) and not (self._IsSimpleTypeContent() or self._IsMixed()))):
+            or isinstance(value, _ElementContentTypes)
+            or (isinstance(value, simpleTypeDefinition) and not (is_simple_content or is_mixed))):
             # Element content.  If it has an automaton we can provide more
             # information.  If it doesn't, it must consume text and we should
             # use a different exception.
-            if self.__automatonConfiguration:
-                raise pyxb.UnrecognizedContentError(self, self.__automatonConfiguration, value, location)
+            if automaton_configuration:
+                raise pyxb.UnrecognizedContentError(self, automaton_configuration, value, location)
             raise pyxb.NonElementValidationError(value, location)
 
         # We have something that doesn't seem to be an element.  Are we
         # expecting simple content?
-        if self._IsSimpleTypeContent():
+        if is_simple_content:
             if self.__content is not None:
                 raise pyxb.ExtraSimpleContentError(self, value)
-            if not self._isNil():
-                if not isinstance(value, self._TypeDefinition):
-                    value = self._TypeDefinition.Factory(value, _from_xml=from_xml)
-                self.__setContent(value)
-                if require_validation:
-                    # NB: This only validates the value, not any associated
-                    # attributes, which is correct to be parallel to complex
-                    # content validation.
-                    self.xsdConstraintsOK(location)
+            if not isinstance(value, self._TypeDefinition):
+                value = self._TypeDefinition.Factory(value, _from_xml=from_xml)
+            self.__setContent(value)
+            if require_validation:
+                # NB: This only validates the value, not any associated
+                # attributes, which is correct to be parallel to complex
+                # content validation.
+                self.xsdConstraintsOK(location)
             return self
 
         # Do we allow non-element content?
-        if not self._IsMixed():
+        if not is_mixed:
             raise pyxb.MixedContentError(self, value, location)
 
         # It's character information.
@@ -2611,10 +3022,9 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
     def extend (self, value_list, _fallback_namespace=None, _from_xml=False, _location=None):
         """Invoke L{append} for each value in the list, in turn."""
-        kw = { '_fallback_namespace': _fallback_namespace,
-               '_from_xml': _from_xml,
-               '_location': _location }
-        [ self.append(_v, **kw) for _v in value_list ]
+        append = self.append
+        for v in value_list:
+            append(v, _fallback_namespace=_fallback_namespace, _from_xml=_from_xml, _location=_location)
         return self
 
     def __setContent (self, value):
@@ -2624,8 +3034,8 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     def _addContent (self, wrapped_value):
         # This assert is inadequate in the case of plural/non-plural elements with an STD_list base type.
         # Trust that validation elsewhere was done correctly.
-        #assert self._IsMixed() or (not self._performValidation()) or isinstance(child, _TypeBinding_mixin) or isinstance(child, six.string_types), 'Unrecognized child %s type %s' % (child, type(child))
-        assert not (self._ContentTypeTag in (self._CT_EMPTY, self._CT_SIMPLE))
+        #assert self._IsMixed() or (not self._performValidation()) or isinstance(child, _TypeBinding_mixin) or isinstance(child, str), 'Unrecognized child %s type %s' % (child, type(child))
+        assert not (self._ContentTypeTag in self.__NonComplexContentTags)
         assert isinstance(wrapped_value, _Content)
         self.__content.append(wrapped_value)
         if isinstance(wrapped_value, ElementContent):
@@ -2647,7 +3057,7 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
     def _postDOMValidate (self):
         # It's probably finalized already, but just in case...
         self._finalizeContentModel()
-        if self._validationConfig.forBinding:
+        if self._validationConfig_.forBinding:
             # @todo isNil should verify that no content is present.
             if (not self._isNil()) and (self.__automatonConfiguration is not None):
                 if not self.__automatonConfiguration.isAccepting():
@@ -2659,12 +3069,12 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
     def _setDOMFromAttributes (self, dom_support, element):
         """Add any appropriate attributes from this instance into the DOM element."""
-        for au in six.itervalues(self._AttributeMap):
+        for au in self.__AttributeUses():
             if pyxb.GlobalValidationConfig.forDocument:
                 au.validate(self)
             au.addDOMAttribute(dom_support, self, element)
         if self.__wildcardAttributeMap:
-            for (an, av) in six.iteritems(self.__wildcardAttributeMap):
+            for (an, av) in self.__wildcardAttributeMap.items():
                 dom_support.addAttribute(element, an, av)
         return element
 
@@ -2697,10 +3107,10 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                         content.value.toDOM(dom_support, parent)
                 else:
                     content.elementDeclaration.toDOM(dom_support, parent, content.value)
-            mixed_content = self.orderedContent()
-            for mc in mixed_content:
-                pass
-        return getattr(super(complexTypeDefinition, self), '_toDOM_csc', lambda *_args,**_kw: dom_support)(dom_support, parent)
+        next_csc = _NextCooperative(complexTypeDefinition, type(self), '_toDOM_csc')
+        if next_csc is None:
+            return dom_support
+        return next_csc(self, dom_support, parent)
 
     @classmethod
     def _IsSimpleTypeContent (cls):
@@ -2709,10 +3119,21 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
 
     @classmethod
     def _description (cls, name_only=False, user_documentation=True):
-        name = cls._Name()
         if name_only:
-            return name
-        desc = [ name ]
+            return cls._Name()
+        # The description is rebuilt if the attribute or element map has
+        # grown since it was cached, which happens only while the binding
+        # class is being constructed.
+        attribute_count = len(cls._AttributeMap)
+        element_count = len(cls._ElementMap)
+        cached = _CTDDescriptionCache.get(cls)
+        if (cached is None) or (cached[0] != attribute_count) or (cached[1] != element_count):
+            cached = _CTDDescriptionCache[cls] = (attribute_count, element_count, cls.__Description())
+        return cached[2]
+
+    @classmethod
+    def __Description (cls):
+        desc = [ cls._Name() ]
         if cls._CT_EMPTY == cls._ContentTypeTag:
             desc.append(', empty content')
         elif cls._CT_SIMPLE == cls._ContentTypeTag:
@@ -2725,16 +3146,20 @@ class complexTypeDefinition (_TypeBinding_mixin, utility._DeconflictSymbols_mixi
                 desc.append(', element-only content')
         if (0 < len(cls._AttributeMap)) or (cls._AttributeWildcard is not None):
             desc.append("\nAttributes:\n  ")
-            desc.append("\n  ".join([ _au._description(user_documentation=False) for _au in six.itervalues(cls._AttributeMap) ]))
+            desc.append("\n  ".join([ _au._description(user_documentation=False) for _au in cls._AttributeMap.values() ]))
             if cls._AttributeWildcard is not None:
                 desc.append("\n  Wildcard attribute(s)")
         if (0 < len(cls._ElementMap)) or cls._HasWildcardElement:
             desc.append("\nElements:\n  ")
-            desc.append("\n  ".join([ _eu._description(user_documentation=False) for _eu in six.itervalues(cls._ElementMap) ]))
+            desc.append("\n  ".join([ _eu._description(user_documentation=False) for _eu in cls._ElementMap.values() ]))
             if cls._HasWildcardElement:
                 desc.append("\n  Wildcard element(s)")
         return ''.join(desc)
 
+# Values of these types can only be element content; see
+# complexTypeDefinition.append.
+_ElementContentTypes = (xml.dom.Node, complexTypeDefinition, pyxb.BIND)
+
 ## Local Variables:
 ## fill-column:78
 ## End:
@@ -505,7 +505,7 @@ class AutomatonConfiguration (object):
         self.__preferredSequenceIndex = 0
         self.__preferredPendingSymbol = None
         self.__pendingNonElementContent = None
-        vc = instance._validationConfig
+        vc = instance._validationConfig_
         preferred_sequence = None
         if (vc.ALWAYS == vc.contentInfluencesGeneration) or (instance._ContentTypeTag == instance._CT_MIXED and vc.MIXED_ONLY == vc.contentInfluencesGeneration):
             preferred_sequence = instance.orderedContent()
@@ -572,7 +572,7 @@ class AutomatonConfiguration (object):
 
         # How validation should be done
         instance = self.__instance
-        vc = instance._validationConfig
+        vc = instance._validationConfig_
 
         # The available content, in a map from ElementDeclaration to in-order
         # values.  The key None corresponds to the wildcard content.  Keys are
@@ -1039,7 +1039,7 @@ class ElementDeclaration (object):
         if ctd_instance._isNil():
             raise pyxb.ContentInNilInstanceError(ctd_instance, value)
         assert self.__elementBinding is not None
-        if ctd_instance._validationConfig.forBinding or isinstance(value, pyxb.BIND):
+        if ctd_instance._validationConfig_.forBinding or isinstance(value, pyxb.BIND):
             value = self.__elementBinding.compatibleValue(value, is_plural=self.isPlural())
         setattr(ctd_instance, self.__key, value)
         ctd_instance._addContent(basis.ElementContent(value, self))
@@ -1061,7 +1061,7 @@ class ElementDeclaration (object):
         if not self.isPlural():
             raise pyxb.NonPluralAppendError(ctd_instance, self, value)
         values = self.value(ctd_instance)
-        if ctd_instance._validationConfig.forBinding:
+        if ctd_instance._validationConfig_.forBinding:
             value = self.__elementBinding.compatibleValue(value)
         values.append(value)
         ctd_instance._addContent(basis.ElementContent(value, self))
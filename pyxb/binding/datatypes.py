@@ -443,7 +443,10 @@ class _PyXBDateTime_base (basis.simpleTypeDefinition, basis._RepresentAsXsdLiter
     def _SetKeysFromPython_csc (cls, python_value, kw, fields):
         for f in fields:
             kw[f] = getattr(python_value, f)
-        return getattr(super(_PyXBDateTime_base, cls), '_SetKeysFromPython_csc', lambda *a,**kw: None)(python_value, kw, fields)
+        super_fn = basis._NextCooperative(_PyXBDateTime_base, cls, '_SetKeysFromPython_csc')
+        if super_fn is None:
+            return None
+        return super_fn(python_value, kw, fields)
 
     @classmethod
     def _SetKeysFromPython (cls, python_value, kw, fields):
@@ -894,15 +897,19 @@ class base64Binary (basis.simpleTypeDefinition, six.binary_type):
     # base64 is too lenient: it accepts 'ZZZ=' as an encoding of
     # 'e\x96', while the required XML Schema production requires
     # 'ZZY='.  Define a regular expression per section 3.2.16.
+    #
+    # Nothing is extracted from the match, so the expression uses no
+    # capturing groups and spells out each quad rather than repeating
+    # a group; both matter on multi-megabyte literals.
 
     _B04 = '[AQgw]'
-    _B04S = '(%s ?)' % (_B04,)
+    _B04S = '%s ?' % (_B04,)
     _B16 = '[AEIMQUYcgkosw048]'
-    _B16S = '(%s ?)' % (_B16,)
+    _B16S = '%s ?' % (_B16,)
     _B64 = '[ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/]'
-    _B64S = '(%s ?)' % (_B64,)
+    _B64S = '%s ?' % (_B64,)
 
-    __Pattern = '^((' + _B64S + '{4})*((' + _B64S + '{3}' + _B64 + ')|(' + _B64S + '{2}' + _B16S + '=)|(' + _B64S + _B04S + '= ?=)))?$'
+    __Pattern = '^(?:(?:' + 4 * _B64S + ')*(?:' + 3 * _B64S + _B64 + '|' + 2 * _B64S + _B16S + '=|' + _B64S + _B04S + '= ?=))?$'
     __Lexical_re = re.compile(__Pattern)
 
     __ValidateLength = None
@@ -1010,7 +1017,9 @@ class QName (basis.simpleTypeDefinition, pyxb.namespace.ExpandedName):
         if 1 == len(args):
             xmlns_context = kw.pop('_xmlns_context', pyxb.namespace.NamespaceContext.Current())
             args = (cls._ConvertIf(args[0], xmlns_context),)
-        super_fn = getattr(super(QName, cls), '_ConvertArguments_vx', lambda *a,**kw: args)
+        super_fn = basis._NextCooperative(QName, cls, '_ConvertArguments_vx')
+        if super_fn is None:
+            return args
         return super_fn(args, kw)
 
     @classmethod
@@ -1024,7 +1033,9 @@ class QName (basis.simpleTypeDefinition, pyxb.namespace.ExpandedName):
 
     @classmethod
     def _XsdConstraintsPreCheck_vb (cls, value):
-        super_fn = getattr(super(QName, cls), '_XsdConstraintsPreCheck_vb', lambda *a,**kw: True)
+        super_fn = basis._NextCooperative(QName, cls, '_XsdConstraintsPreCheck_vb')
+        if super_fn is None:
+            return True
         return super_fn(cls._ConvertIf(value, pyxb.namespace.NamespaceContext.Current()))
 
 
@@ -1095,8 +1106,8 @@ class normalizedString (string):
         are any trickier, you should invoke the superclass
         implementation, and if it returns True then perform additional
         tests."""
-        super_fn = getattr(super(normalizedString, cls), '_ValidateString_va', lambda *a,**kw: True)
-        if not super_fn(value):
+        super_fn = basis._NextCooperative(normalizedString, cls, '_ValidateString_va')
+        if (super_fn is not None) and not super_fn(value):
             return False
         return cls.__ValidateString(value)
 
@@ -1106,7 +1117,9 @@ class normalizedString (string):
             raise SimpleTypeValueError(cls, value)
         if not cls._ValidateString_va(value):
             raise SimpleTypeValueError(cls, value)
-        super_fn = getattr(super(normalizedString, cls), '_XsdConstraintsPreCheck_vb', lambda *a,**kw: True)
+        super_fn = basis._NextCooperative(normalizedString, cls, '_XsdConstraintsPreCheck_vb')
+        if super_fn is None:
+            return True
         return super_fn(value)
 
 _DerivedDatatypes.append(normalizedString)
@@ -1123,8 +1136,8 @@ class token (normalizedString):
 
     @classmethod
     def _ValidateString_va (cls, value):
-        super_fn = getattr(super(token, cls), '_ValidateString_va', lambda *a,**kw: True)
-        if not super_fn(value):
+        super_fn = basis._NextCooperative(token, cls, '_ValidateString_va')
+        if (super_fn is not None) and not super_fn(value):
             return False
         if value.startswith(" ") \
            or value.endswith(" ") \
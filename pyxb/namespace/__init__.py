@@ -25,6 +25,7 @@ import pyxb.utils.utility
 from pyxb.utils import six
 import xml.dom
 import logging
+import weakref
 
 _log = logging.getLogger(__name__)
 
@@ -198,6 +199,38 @@ class ExpandedName (pyxb.cscRoot):
         self.__uriTuple = ( self.__namespaceURI, self.__localName )
         super(ExpandedName, self).__init__(*args, **kw)
 
+    # Map from (namespace URI, local name) to the shared instance returned by
+    # _FromNSLocal, for as long as somebody holds a reference to it.
+    __FromNSLocalCache = weakref.WeakValueDictionary()
+
+    @classmethod
+    def _FromNSLocal (cls, ns_uri, local_name):
+        """Create an expanded name from a namespace URI and a local name.
+
+        The result is the same as C{ExpandedName(ns_uri, local_name)}, but
+        the argument interpretation done by the constructor is bypassed, and
+        while an instance for the pair is alive it is returned rather than a
+        new one.  This is used when converting the attributes of DOM nodes.
+
+        @param ns_uri: The namespace URI as a string, or C{None} if the name
+        has no namespace.
+        @param local_name: The local name as a string."""
+        key = ( ns_uri, local_name )
+        rv = cls.__FromNSLocalCache.get(key)
+        if rv is not None:
+            return rv
+        rv = cls.__new__(cls)
+        ns = None
+        if ns_uri is not None:
+            ns = NamespaceForURI(ns_uri, create_if_missing=True)
+            rv.__namespace = ns
+            rv.__namespaceURI = ns.uri()
+        rv.__localName = local_name
+        rv.__expandedName = ( ns, local_name )
+        rv.__uriTuple = ( rv.__namespaceURI, local_name )
+        cls.__FromNSLocalCache[key] = rv
+        return rv
+
     def __str__ (self):
         assert self.__localName is not None
         if self.__namespaceURI is not None:
@@ -220,8 +253,15 @@ class ExpandedName (pyxb.cscRoot):
         return other
 
     def __eq__ (self, other):
+        if other is self:
+            return True
         if other is None:
             return False
+        # Fast path for the common case of comparing two expanded names, as
+        # in dictionary lookups: the URI tuples hold only strings and None, so
+        # tuple equality agrees with the mixed comparison.
+        if isinstance(other, ExpandedName):
+            return self.__uriTuple == other.__uriTuple
         return 0 == pyxb.utils.utility.IteratedCompareMixed(self.__uriTuple, self.__otherForCompare(other))
 
     def __lt__ (self, other):
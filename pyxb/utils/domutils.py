@@ -16,6 +16,7 @@
 """Functions that support activities related to the Document Object Model."""
 
 import logging
+import threading
 import xml.dom
 
 import pyxb
@@ -280,6 +281,52 @@ class BindingDOMSupport (object):
     def Reset (cls):
         """Reset the global defaults for default/prefix/namespace information."""
         cls.__NamespaceContext.reset()
+        cls.__DiscardPool()
+
+    # Per-thread collection of instances with the default configuration,
+    # recycled by L{_AcquireDefault} and L{_ReleaseDefault}.  Each instance is
+    # tagged with the pool generation in effect when it was created; changing
+    # the global defaults advances the generation so instances derived from
+    # the old defaults are not reused.
+    __Pool = threading.local()
+    __PoolGeneration = 0
+    __PoolLimit = 4
+
+    @classmethod
+    def __DiscardPool (cls):
+        BindingDOMSupport.__PoolGeneration += 1
+
+    @classmethod
+    def _AcquireDefault (cls):
+        """Obtain an instance equivalent to C{BindingDOMSupport()}.
+
+        This is used when generating a document for which the caller did not
+        provide an instance.  Return the instance with L{_ReleaseDefault} once
+        the document it built has been obtained."""
+        pool = BindingDOMSupport.__Pool
+        generation = BindingDOMSupport.__PoolGeneration
+        if getattr(pool, 'generation', None) != generation:
+            pool.generation = generation
+            pool.free = []
+        implementation = GetDOMImplementation()
+        while pool.free:
+            bds = pool.free.pop()
+            if bds.implementation() is implementation:
+                return bds
+        return BindingDOMSupport(implementation=implementation)
+
+    @classmethod
+    def _ReleaseDefault (cls, bds):
+        """Return an instance obtained from L{_AcquireDefault}.
+
+        The instance is reset, so the document it previously generated is no
+        longer referenced by it."""
+        pool = BindingDOMSupport.__Pool
+        if getattr(pool, 'generation', None) != BindingDOMSupport.__PoolGeneration:
+            return
+        if len(pool.free) < BindingDOMSupport.__PoolLimit:
+            bds.reset()
+            pool.free.append(bds)
 
     def __init__ (self, implementation=None, default_namespace=None, require_xsi_type=False, namespace_prefix_map=None):
         """Create a new instance used for building a single document.
@@ -340,6 +387,7 @@ class BindingDOMSupport (object):
         return self.__namespaceContext.setDefaultNamespace(default_namespace)
     @classmethod
     def SetDefaultNamespace (cls, default_namespace):
+        cls.__DiscardPool()
         return cls.__NamespaceContext.setDefaultNamespace(default_namespace)
 
     def declareNamespace (self, namespace, prefix=None):
@@ -348,6 +396,7 @@ class BindingDOMSupport (object):
     @classmethod
     def DeclareNamespace (cls, namespace, prefix=None):
         """Declare a namespace that will made available to each created instance."""
+        cls.__DiscardPool()
         return cls.__NamespaceContext.declareNamespace(namespace, prefix)
 
     def namespacePrefix (self, namespace, enable_default_namespace=True):
@@ -1304,7 +1304,9 @@ class Locatable_mixin (pyxb.cscRoot):
     __location = None
 
     def __init__ (self, *args, **kw):
-        self.__location = kw.pop('location', None)
+        location = kw.pop('location', None)
+        if location is not None:
+            self.__location = location
         super(Locatable_mixin, self).__init__(*args, **kw)
 
     def _setLocation (self, location):
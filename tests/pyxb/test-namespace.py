@@ -93,6 +93,19 @@ class TestExpandedName (unittest.TestCase):
         self.assertEqual(xml.dom.Node.TEXT_NODE, child.nodeType)
         self.assertRaises(pyxb.LogicError, ExpandedName, child)
 
+    def testFromNSLocal (self):
+        ns_uri = 'urn:ns'
+        en = ExpandedName._FromNSLocal(ns_uri, 'local')
+        self.assertEqual(ExpandedName(ns_uri, 'local'), en)
+        self.assertTrue(pyxb.namespace.NamespaceForURI(ns_uri) is en.namespace())
+        self.assertEqual(hash(ExpandedName(ns_uri, 'local')), hash(en))
+        self.assertTrue(ExpandedName._FromNSLocal(ns_uri, 'local') is en)
+        an = ExpandedName._FromNSLocal(None, 'local')
+        self.assertEqual(None, an.namespace())
+        self.assertEqual(None, an.namespaceURI())
+        self.assertEqual(ExpandedName('local'), an)
+        self.assertEqual(hash('local'), hash(an))
+
     def testMapping (self):
         an1 = ExpandedName(None, 'string')
         en1 = ExpandedName(xsd, 'string')
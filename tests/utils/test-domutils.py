@@ -120,5 +120,20 @@ class TestNamespaceURIs (unittest.TestCase):
         self.assertEqual(xml.dom.XMLNS_NAMESPACE, pyxb.namespace.XMLNamespaces.uri())
         self.assertEqual(xml.dom.XHTML_NAMESPACE, pyxb.namespace.XHTML.uri())
 
+class TestBindingDOMSupportPool (unittest.TestCase):
+    def testReuse (self):
+        bds = BindingDOMSupport._AcquireDefault()
+        doc = bds.document()
+        BindingDOMSupport._ReleaseDefault(bds)
+        self.assertFalse(doc is bds.document())
+        self.assertTrue(bds is BindingDOMSupport._AcquireDefault())
+        BindingDOMSupport._ReleaseDefault(bds)
+
+    def testDiscardOnGlobalChange (self):
+        bds = BindingDOMSupport._AcquireDefault()
+        BindingDOMSupport._ReleaseDefault(bds)
+        BindingDOMSupport.Reset()
+        self.assertFalse(bds is BindingDOMSupport._AcquireDefault())
+
 if '__main__' == __name__:
     unittest.main()